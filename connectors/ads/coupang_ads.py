@@ -1,7 +1,7 @@
 import os
-import time
 import json
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Dict, List
 
 from dotenv import load_dotenv
@@ -17,12 +17,34 @@ LOGIN_URL = (
     "&state=6d110f1c-c6e7-44f3-9f48-f5947e4803df&login=true&scope=openid"
 )
 
+WING_HOME_URL = "https://wing.coupang.com/"
+
+# 쿠키가 유지되는 브라우저 프로필 위치 (2일차부터 로그인 생략)
+USER_DATA_DIR = os.path.join("state", "coupang_profile")
+
+# 브라우저 cold start 단축: 불필요한 서브시스템 비활성화
+CHROMIUM_ARGS = [
+    "--disable-blink-features=AutomationControlled",
+    "--disable-dev-shm-usage",
+    "--no-sandbox",
+    "--disable-extensions",
+    "--disable-gpu",
+    "--disable-background-networking",
+    "--disable-sync",
+    "--disable-default-apps",
+]
+
+# 이미지/폰트/미디어 요청 차단 (BLOCK_RESOURCES=false로 끌 수 있음)
+BLOCKED_RESOURCES_GLOB = "**/*.{png,jpg,jpeg,gif,webp,svg,woff,woff2,ttf,mp4}"
+
 TARGET_GRIDCELLS = [
     "260122_뉴턴젤리 수정 삭제",
     "수동_튼살크림_1029 수정 삭제",
 ]
 
 
+# 일 배치라 .env 변경은 프로세스 재시작 시 반영되면 충분
+@lru_cache(maxsize=None)
 def must_env(key: str) -> str:
     v = os.getenv(key)
     if not v:
@@ -34,6 +56,11 @@ def kst_yesterday_ymd() -> str:
     return (datetime.now(KST).date() - timedelta(days=1)).strftime("%Y-%m-%d")
 
 
+def block_heavy_resources(page) -> None:
+    if os.getenv("BLOCK_RESOURCES", "true").lower() == "true":
+        page.route(BLOCKED_RESOURCES_GLOB, lambda route: route.abort())
+
+
 def save_debug(page, prefix: str) -> None:
     os.makedirs("debug", exist_ok=True)
     page.screenshot(path=f"debug/{prefix}.png", full_page=True)
@@ -41,22 +68,21 @@ def save_debug(page, prefix: str) -> None:
         f.write(page.content())
 
 
-def wait_soft(page, ms: int = 200) -> None:
-    # ✅ 대기시간을 줄였고, SPA에서 networkidle이 오래 걸릴 수 있어 timeout 짧게
-    try:
-        page.wait_for_load_state("networkidle", timeout=5_000)
-    except PwTimeoutError:
-        pass
-    if ms > 0:
-        time.sleep(ms / 1000)
-
-
 def login_coupang(page) -> None:
     user = must_env("COUPANG_ID")
     pw = must_env("COUPANG_PW")
 
+    # 프로필에 유효한 세션이 있으면 로그인 페이지로 리다이렉트되지 않음
+    page.goto(WING_HOME_URL, wait_until="domcontentloaded")
+    if "xauth.coupang.com" not in page.url:
+        return
+
     page.goto(LOGIN_URL, wait_until="domcontentloaded")
-    wait_soft(page, 200)
+    # networkidle 대신 비밀번호 입력칸(앵커)을 기다림. iframe 폼이면 아래 scope 탐색으로 처리
+    try:
+        page.locator("input[type='password']").first.wait_for(state="visible", timeout=10_000)
+    except PwTimeoutError:
+        pass
 
     scopes = [page] + list(page.frames)
     submitted = False
@@ -91,8 +117,6 @@ def login_coupang(page) -> None:
         save_debug(page, "coupang_login_form_not_found")
         raise RuntimeError("로그인 폼/버튼을 찾지 못했습니다. debug/coupang_login_form_not_found.* 확인")
 
-    wait_soft(page, 400)
-
 
 def go_to_ad_center(page) -> None:
     # 2) 클릭해서 페이지 이동
@@ -102,7 +126,32 @@ def go_to_ad_center(page) -> None:
 
     # 광고센터 화면이 로드되었다는 신호(앵커)로 tabs-contents를 기다림
     page.locator(".tabs-contents").wait_for(state="visible", timeout=60_000)
-    wait_soft(page, 150)
+
+
+# 기간 버튼 선택 여부: 버튼 자신 + 상위 2단계의 aria-*/class 확인
+_PERIOD_ACTIVE_JS = """el => {
+  for (let n = el, i = 0; n && i < 3; n = n.parentElement, i++) {
+    for (const a of ["aria-pressed", "aria-selected", "aria-checked"]) {
+      if (n.getAttribute(a) === "true") return true;
+    }
+    if (n.matches("input:checked, .active, .selected, .checked, .is-active, .is-selected")) return true;
+  }
+  return false;
+}"""
+
+# 대상 행들의 텍스트를 하나로 합침 (행이 아직 없으면 null) — 매 호출마다 DOM을 새로 탐색하므로 grid 재렌더링에도 안전
+_TARGET_ROWS_TEXT_JS = """names => {
+  const norm = s => (s || "").replace(/\\s+/g, " ").trim();
+  const cells = Array.from(document.querySelectorAll('[role="gridcell"]'));
+  const texts = [];
+  for (const name of names) {
+    const cell = cells.find(c => norm(c.innerText).includes(norm(name)));
+    if (!cell) return null;
+    const row = cell.closest('[role="row"]') || cell.parentElement;
+    texts.push(norm(row.innerText));
+  }
+  return texts.join("\\n");
+}"""
 
 
 def set_yesterday(page) -> None:
@@ -122,8 +171,26 @@ def set_yesterday(page) -> None:
         save_debug(page, "coupang_ad_yesterday_not_found")
         raise RuntimeError("어제 텍스트를 찾지 못했습니다. debug/coupang_ad_yesterday_not_found.* 확인")
 
-    loc.first.click(timeout=20_000)
-    wait_soft(page, 200)
+    # 이미 '어제'가 선택된 상태면 클릭해도 재조회가 없으므로 그대로 읽음
+    if loc.first.evaluate(_PERIOD_ACTIVE_JS):
+        return
+
+    # 클릭 전에도 기본 기간의 gridcell이 이미 보이므로, 대상 행 텍스트가 바뀐 뒤에 읽어야 함
+    # (응답 URL/도메인에 의존하지 않고 화면 값 자체로 판단 → 비콘/폴링 응답에 속지 않음)
+    before = page.evaluate(_TARGET_ROWS_TEXT_JS, TARGET_GRIDCELLS)
+    loc.first.click(timeout=5_000)
+
+    try:
+        page.wait_for_function(
+            f"([names, before]) => {{ const t = ({_TARGET_ROWS_TEXT_JS})(names); return t !== null && t !== before; }}",
+            arg=[TARGET_GRIDCELLS, before],
+            timeout=30_000,
+        )
+    except PwTimeoutError as e:
+        save_debug(page, "coupang_ad_yesterday_no_reload")
+        raise RuntimeError(
+            "어제 클릭 후 대상 행 값이 바뀌지 않았습니다. debug/coupang_ad_yesterday_no_reload.* 확인"
+        ) from e
 
 
 def extract_row_text_by_gridcell(page, gridcell_name: str) -> Dict[str, object]:
@@ -134,30 +201,31 @@ def extract_row_text_by_gridcell(page, gridcell_name: str) -> Dict[str, object]:
     if row.count() == 0:
         row = cell.locator("xpath=ancestor::div[1]")
 
+    # 셀별 inner_text 반복 대신 한 번의 호출로 전체 셀 텍스트 수집
     cells = row.get_by_role("gridcell")
-    n = cells.count()
-    cell_texts: List[str] = []
-    for i in range(n):
-        t = cells.nth(i).inner_text(timeout=10_000).strip()
-        cell_texts.append(t)
+    cell_texts: List[str] = [t.strip() for t in cells.all_inner_texts()]
 
     return {
         "key": gridcell_name,
-        "row_text": row.inner_text(timeout=10_000).strip(),
+        "row_text": row.inner_text(timeout=2_000).strip(),
         "cells": cell_texts,
     }
 
 
 def main():
-    headless = os.getenv("HEADLESS", "false").lower() == "true"
+    headless = os.getenv("HEADLESS", "true").lower() == "true"
 
     with sync_playwright() as p:
-        browser = p.chromium.launch(headless=headless)
-        context = browser.new_context()
-        page = context.new_page()
+        context = p.chromium.launch_persistent_context(
+            user_data_dir=USER_DATA_DIR,
+            headless=headless,
+            args=CHROMIUM_ARGS,
+        )
+        page = context.pages[0] if context.pages else context.new_page()
+        block_heavy_resources(page)
 
         try:
-            # 1) 로그인
+            # 1) 로그인 (프로필 세션이 유효하면 생략)
             login_coupang(page)
 
             # 2) 광고센터 이동
@@ -185,7 +253,6 @@ def main():
             raise RuntimeError(f"실패: {e} (debug/coupang_ad_fail.* 저장됨)") from e
         finally:
             context.close()
-            browser.close()
 
 
 if __name__ == "__main__":
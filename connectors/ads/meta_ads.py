@@ -266,6 +266,7 @@ def main():
     parser = argparse.ArgumentParser()
     parser.add_argument("--date", type=str, default="", help="YYYY-MM-DD (기본: 어제 KST)")
     parser.add_argument("--json", action="store_true", help="마지막 줄에 JSON 결과만 출력")
+    parser.add_argument("--output", type=str, default="", help="러너용: 결과 JSON을 이 경로에 저장")
     args = parser.parse_args()
 
     target_ymd = (args.date or "").strip() or ymd_yesterday_kst()
@@ -318,19 +319,24 @@ def main():
     print(f"  total_purchases: {total_purchases}")
     print("=" * 70)
 
-    # ✅ run_daily_sales_to_gsheet.py가 파싱할 마지막 줄 JSON 출력
+    # run_daily_sales_to_gsheet.py가 "burdenzero / brainology" 키로 받기 쉽게 맞춤
+    out = {
+        "date": target_ymd,
+        "mapped": {
+            "burdenzero": mapped.get("burdenzero", {"spend": 0.0, "purchases": 0}),
+            "brainology": mapped.get("brainology", {"spend": 0.0, "purchases": 0}),
+        },
+        "total": {"spend": total_spend, "purchases": total_purchases},
+    }
+
     if args.json:
-        # run_daily_sales_to_gsheet.py가 "burdenzero / brainology" 키로 받기 쉽게 맞춤
-        out = {
-            "date": target_ymd,
-            "mapped": {
-                "burdenzero": mapped.get("burdenzero", {"spend": 0.0, "purchases": 0}),
-                "brainology": mapped.get("brainology", {"spend": 0.0, "purchases": 0}),
-            },
-            "total": {"spend": total_spend, "purchases": total_purchases},
-        }
         print(json.dumps(out, ensure_ascii=False))
 
+    # ✅ run_daily_sales_to_gsheet.py는 stdout 대신 이 파일을 읽음
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(out, f, ensure_ascii=False)
+
 
 if __name__ == "__main__":
     main()
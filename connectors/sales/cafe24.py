@@ -5,17 +5,41 @@ import time
 import json
 import argparse
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from dotenv import load_dotenv
-from playwright.sync_api import sync_playwright, TimeoutError as PwTimeoutError
+from playwright.sync_api import sync_playwright, Error as PwError, TimeoutError as PwTimeoutError
 
 load_dotenv()
 
 KST = timezone(timedelta(hours=9))
 
+_SALES_RE = re.compile(r"([\d,]+)\s*원")
+_ORDERS_RE = re.compile(r"(\d+)\s*건")
+
+# 로그인 세션(쿠키) 저장 위치: state/cafe24_{profile}.json
+STATE_DIR = "state"
+
+# 브라우저 cold start 단축: 불필요한 서브시스템 비활성화
+CHROMIUM_ARGS = [
+    "--disable-blink-features=AutomationControlled",
+    "--disable-dev-shm-usage",
+    "--no-sandbox",
+    "--disable-extensions",
+    "--disable-gpu",
+    "--disable-background-networking",
+    "--disable-sync",
+    "--disable-default-apps",
+]
+
+# 이미지/폰트/미디어 요청 차단 (BLOCK_RESOURCES=false로 끌 수 있음)
+BLOCKED_RESOURCES_GLOB = "**/*.{png,jpg,jpeg,gif,webp,svg,woff,woff2,ttf,mp4}"
+
 
 # ---------------------------
 # Helpers
 # ---------------------------
+# 일 배치라 .env 변경은 프로세스 재시작 시 반영되면 충분
+@lru_cache(maxsize=None)
 def must_env(key: str) -> str:
     v = os.getenv(key)
     if not v:
@@ -23,10 +47,11 @@ def must_env(key: str) -> str:
     return v
 
 
+@lru_cache(maxsize=None)
 def must_env_profile(profile: str, suffix: str) -> str:
     """
     profile: burdenzero | brainology
-    suffix: ADMIN_URL / ADMIN_ID / ADMIN_PW / GRID_SELECTOR / POST_LOGIN_WAIT_MS ...
+    suffix: ADMIN_URL / ADMIN_ID / ADMIN_PW / GRID_SELECTOR ...
     env key example:
       CAFE24_BURDENZERO_ADMIN_URL
       CAFE24_BRAINOLOGY_ADMIN_URL
@@ -36,20 +61,54 @@ def must_env_profile(profile: str, suffix: str) -> str:
     return must_env(key)
 
 
-def normalize_text(text: str) -> str:
-    return re.sub(r"\s+", " ", (text or "")).strip()
+def block_heavy_resources(page) -> None:
+    if os.getenv("BLOCK_RESOURCES", "true").lower() == "true":
+        page.route(BLOCKED_RESOURCES_GLOB, lambda route: route.abort())
 
 
 def save_debug(page, prefix: str = "fail") -> None:
     os.makedirs("debug", exist_ok=True)
-    page.screenshot(path=f"debug/{prefix}.png", full_page=True)
+    page.screenshot(path=f"debug/{prefix}.png", full_page=False)
     with open(f"debug/{prefix}.html", "w", encoding="utf-8") as f:
         f.write(page.content())
 
 
+def state_path_for(profile: str) -> str:
+    return os.path.join(STATE_DIR, f"cafe24_{profile}.json")
+
+
+def is_state_fresh(path: str, max_age_hours: float) -> bool:
+    try:
+        age_sec = time.time() - os.path.getmtime(path)
+    except OSError:
+        return False
+    return age_sec < max_age_hours * 3600
+
+
+def save_state(context, path: str) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    context.storage_state(path=path)
+
+
 # ---------------------------
 # Cafe24 flow
 # ---------------------------
+def restore_session(page, profile: str) -> bool:
+    """
+    저장된 세션으로 관리자 화면 진입 시도.
+    grid가 5초 안에 보이면 로그인 생략, 아니면(세션 만료) False
+    """
+    url = must_env_profile(profile, "ADMIN_URL")
+    grid_selector = must_env_profile(profile, "GRID_SELECTOR")
+
+    page.goto(url, wait_until="domcontentloaded")
+    try:
+        page.wait_for_selector(grid_selector, timeout=5_000)
+        return True
+    except PwTimeoutError:
+        return False
+
+
 def login_cafe24(page, profile: str) -> None:
     url = must_env_profile(profile, "ADMIN_URL")
     user = must_env_profile(profile, "ADMIN_ID")
@@ -98,73 +157,63 @@ def login_cafe24(page, profile: str) -> None:
 
 
 def wait_after_login(page, profile: str) -> None:
-    try:
-        page.wait_for_load_state("networkidle", timeout=30_000)
-    except PwTimeoutError:
-        pass
+    # networkidle 대신 로그인 후 화면의 grid(앵커)가 보일 때까지 대기
+    grid_selector = must_env_profile(profile, "GRID_SELECTOR")
+    page.wait_for_selector(grid_selector, timeout=30_000)
 
-    # profile별 대기시간 지원 (없으면 기본 1500ms)
-    wait_ms_key = f"CAFE24_{profile.strip().upper()}_POST_LOGIN_WAIT_MS"
-    wait_ms = int(os.getenv(wait_ms_key, os.getenv("CAFE24_POST_LOGIN_WAIT_MS", "1500")))
-    if wait_ms > 0:
-        time.sleep(wait_ms / 1000)
 
+# grid 안의 (row, col) 셀 텍스트를 공백 정규화해서 반환 (table / role 기반 grid 모두 대응)
+# 셀이 아직 없거나 비어 있으면 "" → 채워질 때까지 재시도
+_CELL_TEXT_JS = """(g, [r, c]) => {
+  const row = g.querySelectorAll("tr, [role='row']")[r];
+  const cell = row ? row.querySelectorAll("td, th, [role='cell'], [role='gridcell']")[c] : null;
+  return cell ? cell.innerText.replace(/\\s+/g, " ").trim() : "";
+}"""
 
-def scrape_cell_3_3_text(page, profile: str) -> str:
+
+def scrape_cell_text(page, profile: str, row_idx: int, col_idx: int) -> str:
+    """
+    locator 체인(.nth() 왕복) 대신 JS 1개로 셀 텍스트 추출, 빈 셀이면 채워질 때까지 재시도
+    - 매 시도마다 grid를 locator로 다시 찾음 → 로딩용 table이 데이터 table로 교체돼도 새 노드를 읽음
+    """
     grid_selector = must_env_profile(profile, "GRID_SELECTOR")
 
     page.wait_for_selector(grid_selector, timeout=30_000)
     grid = page.locator(grid_selector).first
-
-    # role 기반 우선
-    try:
-        row3 = grid.get_by_role("row").nth(2)
-        cell = row3.get_by_role("cell").nth(2)  # 3행 3열
-        text = normalize_text(cell.inner_text())
+    deadline = time.monotonic() + 15
+    while True:
+        try:
+            text = grid.evaluate(_CELL_TEXT_JS, [row_idx, col_idx], timeout=5_000)
+        except PwError:
+            # 평가 도중 grid 노드가 교체/분리된 경우 → 다음 시도에서 다시 찾음
+            text = ""
         if text:
             return text
-    except Exception:
-        pass
+        if time.monotonic() >= deadline:
+            raise RuntimeError(
+                f"[{profile}] grid {row_idx + 1}행 {col_idx + 1}열 셀을 찾지 못했습니다(미렌더링/빈 셀). "
+                f"GRID_SELECTOR={grid_selector}"
+            )
+        page.wait_for_timeout(200)
 
-    # table 기반 fallback
-    row3 = grid.locator("tr").nth(2)
-    cell = row3.locator("td,th").nth(2)  # 3행 3열
-    text = normalize_text(cell.inner_text())
-    return text
+
+def scrape_cell_3_3_text(page, profile: str) -> str:
+    """3행 3열(매출/구매수 칸) 텍스트 크롤링"""
+    return scrape_cell_text(page, profile, 2, 2)
 
 
 def scrape_cell_3_4_text(page, profile: str) -> str:
     """3행 4열(환불 칸) 텍스트 크롤링"""
-    grid_selector = must_env_profile(profile, "GRID_SELECTOR")
-
-    page.wait_for_selector(grid_selector, timeout=30_000)
-    grid = page.locator(grid_selector).first
-
-    # role 기반 우선
-    try:
-        row3 = grid.get_by_role("row").nth(2)
-        cell = row3.get_by_role("cell").nth(3)  # 3행 4열
-        text = normalize_text(cell.inner_text())
-        if text:
-            return text
-    except Exception:
-        pass
-
-    # table 기반 fallback
-    row3 = grid.locator("tr").nth(2)
-    cell = row3.locator("td,th").nth(3)  # 3행 4열
-    text = normalize_text(cell.inner_text())
-    return text
+    return scrape_cell_text(page, profile, 2, 3)
 
 
 def parse_sales_and_orders(raw: str) -> tuple[int, int]:
     """
     예: '688,100 원 19건' -> (688100, 19)
+    NOTE: raw는 호출부(scrape_cell_text)에서 이미 공백 정규화된 값이어야 함
     """
-    raw = normalize_text(raw)
-
-    m_sales = re.search(r"([\d,]+)\s*원", raw)
-    m_orders = re.search(r"(\d+)\s*건", raw)
+    m_sales = _SALES_RE.search(raw)
+    m_orders = _ORDERS_RE.search(raw)
 
     if not m_sales or not m_orders:
         raise ValueError(f"텍스트에서 매출/구매수를 파싱하지 못했습니다: {raw}")
@@ -194,23 +243,31 @@ def get_daily_metrics(profile: str, target_date=None) -> dict:
     if target_date is None:
         target_date = (datetime.now(KST) - timedelta(days=1)).date()
 
-    headless = os.getenv("HEADLESS", "false").lower() == "true"
+    headless = os.getenv("HEADLESS", "true").lower() == "true"
+
+    # 저장된 세션이 N시간 이내면 재사용 (기본 48시간 — 일 1회 실행에서도 다음날 재사용되도록)
+    state_path = state_path_for(profile)
+    max_age_hours = float(os.getenv("CAFE24_STATE_MAX_AGE_HOURS", "48"))
+    use_state = is_state_fresh(state_path, max_age_hours)
 
     with sync_playwright() as p:
-        browser = p.chromium.launch(headless=headless)
-        context = browser.new_context()
+        browser = p.chromium.launch(headless=headless, args=CHROMIUM_ARGS)
+        context = browser.new_context(storage_state=state_path) if use_state else browser.new_context()
         page = context.new_page()
+        block_heavy_resources(page)
 
         try:
-            login_cafe24(page, profile=profile)
-            wait_after_login(page, profile=profile)
-
-            # 운영 안정화되면 아래 디버그는 꺼도 됨 (필요하면 env로 끄기)
-            if os.getenv("CAFE24_DEBUG", "false").lower() == "true":
-                os.makedirs("debug", exist_ok=True)
-                page.screenshot(path=f"debug/{profile}_after_login.png", full_page=True)
-                with open(f"debug/{profile}_after_login.html", "w", encoding="utf-8") as f:
-                    f.write(page.content())
+            if not (use_state and restore_session(page, profile=profile)):
+                if use_state:
+                    # 복원 실패(만료 또는 grid 지연) → 복원 쿠키가 남은 컨텍스트에서는 로그인 폼이 안 뜰 수 있어 새 컨텍스트로 로그인
+                    context.close()
+                    context = browser.new_context()
+                    page = context.new_page()
+                    block_heavy_resources(page)
+                login_cafe24(page, profile=profile)
+                wait_after_login(page, profile=profile)
+            # 복원 성공 시에도 저장 → 갱신된 쿠키 반영 + 파일 mtime 갱신 (세션 연장)
+            save_state(context, state_path)
 
             # 3행 3열: 매출/구매수
             raw = scrape_cell_3_3_text(page, profile=profile)
@@ -250,6 +307,7 @@ def main():
     ap = argparse.ArgumentParser()
     ap.add_argument("--profile", required=False, default="burdenzero", choices=["burdenzero", "brainology"])
     ap.add_argument("--date", required=False, help="YYYY-MM-DD (기록용). 기본: 전날(KST)")
+    ap.add_argument("--output", required=False, help="러너용: 결과 JSON을 이 경로에 저장")
     args = ap.parse_args()
 
     if args.date:
@@ -260,6 +318,10 @@ def main():
     result = get_daily_metrics(profile=args.profile, target_date=target_date)
     print(json.dumps(result, ensure_ascii=False))
 
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False)
+
 
 if __name__ == "__main__":
     main()
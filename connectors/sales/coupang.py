@@ -231,19 +231,30 @@ def aggregate_by_brand(product_agg: Dict[str, ProductAgg]) -> Dict[str, ProductA
     return result
 
 
-def main():
-    parser = argparse.ArgumentParser(description="Coupang: product excel download -> net sales/qty -> brand summary")
-    parser.add_argument("--date", help="집계 날짜 (YYYY-MM-DD). 기본: 어제(KST)", default=None)
-    parser.add_argument("--json", action="store_true", help="러너용: 마지막 줄에 JSON 1줄 출력")
-    args = parser.parse_args()
+# ---------------------------
+# Public API for runner
+# ---------------------------
+def get_daily_metrics(target_date=None) -> dict:
+    """
+    Returns:
+      {
+        "status": "ok",
+        "source": "coupang",
+        "date": "YYYY-MM-DD",
+        "total_sales": int,
+        "total_qty": int,
+        "brand_summary": {...},
+        "mapped": {"burdenzero": {...}, "brainology": {...}, "ppadi": {...}},
+        ...
+      }
+    """
+    if target_date is None:
+        ymd = kst_yesterday_ymd()
+    else:
+        ymd = target_date.strftime("%Y-%m-%d")
 
     headless = os.getenv("HEADLESS", "false").lower() == "true"
 
-    if args.date:
-        ymd = datetime.strptime(args.date, "%Y-%m-%d").date().strftime("%Y-%m-%d")
-    else:
-        ymd = kst_yesterday_ymd()
-
     url = build_sales_url(ymd)
 
     with sync_playwright() as p:
@@ -307,10 +318,7 @@ def main():
                 "mapped": mapped,
             }
 
-            if args.json:
-                print(json.dumps(payload, ensure_ascii=False))
-            else:
-                print(payload)
+            return payload
 
         except Exception as e:
             save_debug(page, "coupang_fail")
@@ -320,5 +328,28 @@ def main():
             browser.close()
 
 
+# ---------------------------
+# CLI
+# ---------------------------
+def main():
+    parser = argparse.ArgumentParser(description="Coupang: product excel download -> net sales/qty -> brand summary")
+    parser.add_argument("--date", help="집계 날짜 (YYYY-MM-DD). 기본: 어제(KST)", default=None)
+    parser.add_argument("--json", action="store_true", help="마지막 줄에 JSON 1줄 출력")
+    parser.add_argument("--output", default=None, help="러너용: 결과 JSON을 이 경로에 저장")
+    args = parser.parse_args()
+
+    target_date = datetime.strptime(args.date, "%Y-%m-%d").date() if args.date else None
+    payload = get_daily_metrics(target_date=target_date)
+
+    if args.json:
+        print(json.dumps(payload, ensure_ascii=False))
+    else:
+        print(payload)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False)
+
+
 if __name__ == "__main__":
     main()
@@ -1,30 +1,48 @@
 import os
 import re
+import signal
+import time
+import hashlib
+import argparse
+import math
 import json
-import ast
 import subprocess
+import sys
+import tempfile
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional, Tuple
+from functools import lru_cache, partial
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import gspread
+from google.auth.transport.requests import AuthorizedSession
 from google.oauth2.service_account import Credentials
 from dotenv import load_dotenv
 
 # ✅ Slack 전송(웹훅) 추가
 import requests
 
+# 네이버는 Playwright 없이 API만 호출하므로 서브프로세스 대신 프로세스 내에서 직접 호출
+from connectors.sales import naver
+
 KST = timezone(timedelta(hours=9))
 LOGGER = logging.getLogger("daily_sales")
 
 SPREADSHEET_ID = "1DeSRVN4pWf6rnp1v_FeePUYe1ngjwyq_znXZUzl_kbM"
 SHEET_BURDENZERO = "부담제로"
 SHEET_BRAINOLOGY = "뉴턴젤리"
+SHEETS_API_BASE = "https://sheets.googleapis.com/v4/spreadsheets"
 
 # ✅ 해결 1: Playwright temp 경로를 안정적으로 고정
 SAFE_TEMP_DIR = r"C:\Temp"
 
+# 같은 날짜 재실행(디버그/부분 실패 재시도) 시 커넥터 결과 재사용
+CACHE_DIR = os.path.join(SAFE_TEMP_DIR, "d_check_cache")
+
+_NONDIGIT_RE = re.compile(r"[^\d\-]")
+
 
 @dataclass
 class DailyMetrics:
@@ -33,44 +51,103 @@ class DailyMetrics:
 
 
 def yday_kst_date():
-    return (datetime.now(KST) - timedelta(days=1)).date()
+    return (datetime.fromtimestamp(time.time(), KST) - timedelta(days=1)).date()
 
 
 # ---------------------------
 # Google Sheets
 # ---------------------------
-def gspread_client_from_service_account() -> gspread.Client:
+# 크론 실행 중 GOOGLE_SA_JSON은 바뀌지 않으므로 인증된 세션/클라이언트 1개를 재사용
+@lru_cache(maxsize=1)
+def sheets_session_from_service_account() -> AuthorizedSession:
+    """
+    서비스계정 인증 + HTTP keep-alive 세션
+    (같은 세션을 공유하면 batchGet/batchUpdate 사이에 TLS 핸드셰이크를 다시 하지 않음)
+    """
     sa_path = os.getenv("GOOGLE_SA_JSON")
-    if not sa_path or not os.path.exists(sa_path):
-        raise RuntimeError(
-            "GOOGLE_SA_JSON 환경변수에 서비스계정 JSON 경로가 필요합니다. "
-            "예) GOOGLE_SA_JSON=C:\\keys\\moncgroup-gsheet-sa.json"
-        )
-
     scopes = [
         "https://www.googleapis.com/auth/spreadsheets",
         "https://www.googleapis.com/auth/drive",
     ]
-    creds = Credentials.from_service_account_file(sa_path, scopes=scopes)
-    return gspread.authorize(creds)
+    try:
+        # 미설정(None) → TypeError, 경로 없음 → FileNotFoundError
+        creds = Credentials.from_service_account_file(sa_path, scopes=scopes)
+    except (FileNotFoundError, TypeError) as e:
+        raise RuntimeError(
+            "GOOGLE_SA_JSON 환경변수에 서비스계정 JSON 경로가 필요합니다. "
+            "예) GOOGLE_SA_JSON=C:\\keys\\moncgroup-gsheet-sa.json"
+        ) from e
+    return AuthorizedSession(creds)
+
+
+@lru_cache(maxsize=1)
+def gspread_client_from_service_account() -> gspread.Client:
+    session = sheets_session_from_service_account()
+    return gspread.Client(auth=session.credentials, session=session)
+
+
+def read_rows_batch(sh: gspread.Spreadsheet, sheet_titles: List[str]) -> Dict[str, List[List[Any]]]:
+    """
+    여러 워크시트의 A~K를 values.batchGet 1회로 읽음
+    - 숫자는 원본 값(UNFORMATTED_VALUE), 날짜는 표시 문자열 그대로(A열 날짜 비교용)
+    Returns: {sheet_title: [[A1, B1, ...], [A2, B2, ...], ...]}
+    """
+    resp = sh.values_batch_get(
+        [f"'{title}'!A:K" for title in sheet_titles],
+        params={"valueRenderOption": "UNFORMATTED_VALUE", "dateTimeRenderOption": "FORMATTED_STRING"},
+    )
+    value_ranges = resp.get("valueRanges") or []
+    return {title: (vr.get("values") or []) for title, vr in zip(sheet_titles, value_ranges)}
+
+
+def col_a_of(rows: List[List[Any]]) -> List[str]:
+    """
+    A:K 응답에서 A열만 추출
+    A열이 빈 채로 B~K에만 값이 있는 아래쪽 행(메모/합계 등)은 잘라냄 → 다음 날짜 행 = 마지막 날짜 + 1
+    """
+    col_a = [(str(r[0]) if r else "") for r in rows]
+    while col_a and not col_a[-1].strip():
+        col_a.pop()
+    return col_a
 
 
-def find_or_create_row_by_date(ws: gspread.Worksheet, date_str: str) -> int:
-    col_a = ws.col_values(1)
-    for idx, val in enumerate(col_a, start=1):
-        if (val or "").strip() == date_str:
+def row_values_of(rows: List[List[Any]], row: int, date_str: str) -> List[Any]:
+    """해당 행의 A~K 값. A열이 date_str인 기존 행일 때만 반환 (새로 만들 행이면 [])"""
+    if row > len(rows):
+        return []
+    values = rows[row - 1]
+    if not values or str(values[0]).strip() != date_str:
+        return []
+    return values
+
+
+def find_or_create_row_by_date(
+    sheet_title: str,
+    col_a: List[str],
+    date_str: str,
+    data: List[Dict[str, Any]],
+) -> int:
+    """
+    col_a에서 date_str 행을 찾음. 없으면 다음 행 번호를 반환하고
+    A열 날짜 기록을 data(batchUpdate 목록)에 추가
+    (날짜가 하루씩 아래로 쌓이므로 끝에서부터 찾으면 보통 바로 걸림)
+    """
+    for idx in range(len(col_a), 0, -1):
+        val = col_a[idx - 1]
+        if val and val.strip() == date_str:
             return idx
-    ws.append_row([date_str], value_input_option="USER_ENTERED")
-    return len(col_a) + 1
+    row = len(col_a) + 1
+    data.append({"range": f"'{sheet_title}'!A{row}", "values": [[date_str]]})
+    return row
 
 
-def write_metrics_row(
-    ws: gspread.Worksheet,
+def metrics_row_update(
+    sheet_title: str,
     row: int,
     cafe24: Optional[DailyMetrics],
     coupang: Optional[DailyMetrics],
     naver: Optional[DailyMetrics],
-) -> None:
+) -> Dict[str, Any]:
     # B~G
     values = [
         cafe24.sales if cafe24 else "",
@@ -80,16 +157,36 @@ def write_metrics_row(
         naver.sales if naver else "",
         naver.orders if naver else "",
     ]
-    ws.update(f"B{row}:G{row}", [values], value_input_option="USER_ENTERED")
+    return {"range": f"'{sheet_title}'!B{row}:G{row}", "values": [values]}
 
 
-def write_meta_row(ws: gspread.Worksheet, row: int, spend: Optional[int], purchases: Optional[int]) -> None:
+def meta_row_update(sheet_title: str, row: int, spend: Optional[int], purchases: Optional[int]) -> Dict[str, Any]:
     # J~K
     values = [
         spend if spend is not None else "",
         purchases if purchases is not None else "",
     ]
-    ws.update(f"J{row}:K{row}", [values], value_input_option="USER_ENTERED")
+    return {"range": f"'{sheet_title}'!J{row}:K{row}", "values": [values]}
+
+
+def batch_update_values(session: AuthorizedSession, spreadsheet_id: str, data: List[Dict[str, Any]]) -> None:
+    """
+    여러 범위 쓰기를 values.batchUpdate 1회로 전송
+    - gspread 레이어 없이 v4 REST를 공유 세션으로 직접 호출, 응답에 값은 포함하지 않음
+    """
+    if not data:
+        return
+    url = f"{SHEETS_API_BASE}/{spreadsheet_id}/values:batchUpdate"
+    body = {
+        "valueInputOption": "USER_ENTERED",
+        "includeValuesInResponse": False,
+        "data": data,
+    }
+    r = session.post(url, json=body, timeout=30)
+    if r.status_code < 200 or r.status_code >= 300:
+        raise RuntimeError(
+            f"시트 기록 실패(values:batchUpdate): status={r.status_code} body={(r.text or '')[:500]}"
+        )
 
 
 # ---------------------------
@@ -163,38 +260,53 @@ def build_slack_summary(
 
 
 # ---------------------------
-# Subprocess JSON parsing
+# Subprocess runner
 # ---------------------------
-def _extract_last_object(text: str) -> Dict[str, Any]:
-    lines = [ln.strip() for ln in text.splitlines() if ln.strip()]
-    if not lines:
-        raise RuntimeError("stdout이 비어있습니다.")
-
-    for ln in reversed(lines):
-        if ln.startswith("{") and ln.endswith("}"):
-            try:
-                return json.loads(ln)
-            except Exception:
-                pass
-            try:
-                return ast.literal_eval(ln)
-            except Exception:
-                pass
-
-        if "{" in ln and "}" in ln:
-            m = re.search(r"(\{.*\})", ln)
-            if m:
-                chunk = m.group(1)
-                try:
-                    return json.loads(chunk)
-                except Exception:
-                    pass
-                try:
-                    return ast.literal_eval(chunk)
-                except Exception:
-                    pass
-
-    raise RuntimeError("stdout에서 파싱 가능한 JSON/dict 객체를 찾지 못했습니다.")
+# 실패 메시지에는 stdout/stderr 끝부분만 포함 (Playwright 로그가 수 MB여도 메시지 크기 고정)
+OUTPUT_TAIL_CHARS = 65536
+
+
+def _tail(text: Optional[str], limit: int = OUTPUT_TAIL_CHARS) -> str:
+    text = text or ""
+    if len(text) <= limit:
+        return text
+    return f"...(앞부분 {len(text) - limit}자 생략)\n" + text[-limit:]
+
+
+@lru_cache(maxsize=1)
+def child_env() -> Dict[str, str]:
+    """
+    서브프로세스 공용 환경변수 (첫 호출 시 1회만 생성, subprocess는 env를 수정하지 않으므로 공유해도 안전)
+    - main()의 load_dotenv() 이후에 호출되어야 .env 값이 포함됨
+    """
+    return {
+        **os.environ,
+        # 1) Playwright artifacts temp 안정화
+        "TEMP": SAFE_TEMP_DIR,
+        "TMP": SAFE_TEMP_DIR,
+        # 2) Windows 콘솔 인코딩 이슈 방지 (서브프로세스 파이썬 출력 UTF-8 강제)
+        "PYTHONUTF8": "1",
+        "PYTHONIOENCODING": "utf-8",
+    }
+
+
+def _kill_process_tree(p: subprocess.Popen) -> None:
+    """
+    서브프로세스 + 자식(Playwright 드라이버/Chromium)까지 강제 종료
+    - p.kill()만 하면 손자 프로세스가 남아 파이프를 잡고 있어 communicate()가 끝나지 않음
+    """
+    if os.name == "nt":
+        subprocess.run(
+            ["taskkill", "/F", "/T", "/PID", str(p.pid)],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        return
+    try:
+        # start_new_session=True로 띄웠으므로 pgid == pid
+        os.killpg(p.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
 
 
 def run_script(script_path: str, args: List[str]) -> Dict[str, Any]:
@@ -206,39 +318,169 @@ def run_script(script_path: str, args: List[str]) -> Dict[str, Any]:
     # TEMP 폴더가 없으면 파이썬에서 생성 (CMD/스케줄러에서도 안전)
     os.makedirs(SAFE_TEMP_DIR, exist_ok=True)
 
-    env = os.environ.copy()
+    env = child_env()
 
-    # 1) Playwright artifacts temp 안정화
-    env["TEMP"] = SAFE_TEMP_DIR
-    env["TMP"] = SAFE_TEMP_DIR
+    # 결과는 stdout 파싱 대신 --output JSON 파일로 전달받음
+    fd, output_path = tempfile.mkstemp(suffix=".json", dir=SAFE_TEMP_DIR)
+    os.close(fd)
 
-    # 2) Windows 콘솔 인코딩 이슈 방지 (서브프로세스 파이썬 출력 UTF-8 강제)
-    env["PYTHONUTF8"] = "1"
-    env["PYTHONIOENCODING"] = "utf-8"
-
-    cmd = ["python", script_path] + args
+    # PATH 탐색 없이 현재 인터프리터 그대로 사용, -u로 출력 버퍼링 해제
+    # (-I는 PYTHONUTF8/PYTHONIOENCODING을 무시하게 되므로 사용하지 않음)
+    cmd = [sys.executable, "-u", script_path] + args + ["--output", output_path]
     LOGGER.info("RUN: %s", " ".join(cmd))
 
-    p = subprocess.run(
-        cmd,
-        capture_output=True,
-        text=True,
-        encoding="utf-8",
-        env=env,  # ✅ 핵심: 서브프로세스에 환경변수 전달
-    )
+    timeout_sec = int(os.getenv("DAILY_SCRIPT_TIMEOUT_SEC", "600"))
 
-    if p.returncode != 0:
-        raise RuntimeError(
-            f"스크립트 실패: {script_path}\nSTDOUT:\n{p.stdout}\nSTDERR:\n{p.stderr}"
+    try:
+        # communicate()가 stdout/stderr를 동시에 계속 비워주므로 파이프가 차서 멈추는 일이 없음
+        p = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            encoding="utf-8",
+            bufsize=-1,
+            env=env,  # ✅ 핵심: 서브프로세스에 환경변수 전달
+            # 별도 프로세스 그룹으로 실행 → 시간 초과 시 그룹 전체 종료 (Windows는 taskkill /T 사용)
+            start_new_session=(os.name != "nt"),
         )
-    return _extract_last_object(p.stdout)
+        try:
+            out, err = p.communicate(timeout=timeout_sec)
+        except subprocess.TimeoutExpired as e:
+            _kill_process_tree(p)
+            out, err = p.communicate()
+            raise RuntimeError(
+                f"스크립트 시간 초과({timeout_sec}s): {script_path}\nSTDOUT:\n{_tail(out)}\nSTDERR:\n{_tail(err)}"
+            ) from e
+
+        if p.returncode != 0:
+            raise RuntimeError(
+                f"스크립트 실패: {script_path}\nSTDOUT:\n{_tail(out)}\nSTDERR:\n{_tail(err)}"
+            )
+        with open(output_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    finally:
+        os.remove(output_path)
+
+
+def _cache_key(script_path: str, args: List[str]) -> str:
+    # args에 --date가 포함되므로 (script, args)만으로 날짜별 키가 됨
+    raw = json.dumps([script_path.replace("\\", "/"), args], ensure_ascii=False)
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def _cache_get(key: str, ttl_sec: float) -> Optional[Dict[str, Any]]:
+    path = os.path.join(CACHE_DIR, f"{key}.json")
+    try:
+        if time.time() - os.path.getmtime(path) > ttl_sec:
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _cache_put(key: str, payload: Dict[str, Any]) -> None:
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(os.path.join(CACHE_DIR, f"{key}.json"), "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False)
+    except OSError as e:
+        LOGGER.warning("커넥터 결과 캐시 저장 실패: %s", e)
+
+
+def run_script_cached(script_path: str, args: List[str], use_cache: bool = True) -> Dict[str, Any]:
+    """
+    run_script + 디스크 캐시 (CACHE_DIR/{sha1}.json)
+    - DAILY_CACHE_TTL_HOURS(기본 6) 이내 결과가 있으면 서브프로세스 실행 생략
+    - use_cache=False(--no-cache)면 항상 새로 실행하고 결과만 갱신
+    """
+    key = _cache_key(script_path, args)
+    if use_cache:
+        ttl_sec = float(os.getenv("DAILY_CACHE_TTL_HOURS", "6")) * 3600
+        cached = _cache_get(key, ttl_sec)
+        if cached is not None:
+            LOGGER.info("CACHE HIT: %s %s", script_path, " ".join(args))
+            return cached
+
+    payload = run_script(script_path, args)
+    _cache_put(key, payload)
+    return payload
+
+
+# 채널별로 채우는 (시트, (열 인덱스 2개)) — A=0, B=1 ...
+# 재실행 시 해당 칸이 전부 채워져 있으면 그 커넥터는 생략하고 시트 값을 그대로 사용
+CHANNEL_CELLS: Dict[str, List[Tuple[str, Tuple[int, int]]]] = {
+    "cafe24_bz": [(SHEET_BURDENZERO, (1, 2))],
+    "cafe24_br": [(SHEET_BRAINOLOGY, (1, 2))],
+    "coupang": [(SHEET_BURDENZERO, (3, 4)), (SHEET_BRAINOLOGY, (3, 4))],
+    "naver": [(SHEET_BURDENZERO, (5, 6))],
+    "meta_ads": [(SHEET_BURDENZERO, (9, 10)), (SHEET_BRAINOLOGY, (9, 10))],
+}
+
+
+def _filled_pair(row_values: List[Any], cols: Tuple[int, int]) -> Optional[Tuple[int, int]]:
+    vals = [row_values[c] if c < len(row_values) else "" for c in cols]
+    if any(not str(v).strip() for v in vals):
+        return None
+    return _as_int(vals[0]), _as_int(vals[1])
+
+
+def payload_from_sheet(channel: str, existing: Dict[str, List[Any]]) -> Optional[Dict[str, Any]]:
+    """
+    시트에 이미 기록된 값으로 커넥터 payload를 재구성 (metrics_from_* 입력 형태)
+    existing: {sheet_title: 해당 날짜 행 값}. 채널 칸이 하나라도 비어 있으면 None
+    """
+    pairs = []
+    for title, cols in CHANNEL_CELLS[channel]:
+        pair = _filled_pair(existing.get(title) or [], cols)
+        if pair is None:
+            return None
+        pairs.append(pair)
+
+    if channel == "coupang":
+        (bz_sales, bz_orders), (br_sales, br_orders) = pairs
+        return {
+            "mapped": {
+                "burdenzero": {"sales": bz_sales, "orders": bz_orders},
+                "brainology": {"sales": br_sales, "orders": br_orders},
+            }
+        }
+    if channel == "meta_ads":
+        (bz_spend, bz_purch), (br_spend, br_purch) = pairs
+        return {
+            "mapped": {
+                "burdenzero": {"spend": bz_spend, "purchases": bz_purch},
+                "brainology": {"spend": br_spend, "purchases": br_purch},
+            }
+        }
+    (sales, orders), = pairs
+    return {"sales": sales, "orders": orders}
+
+
+def run_jobs_parallel(jobs: Dict[str, Callable[[], Dict[str, Any]]]) -> Dict[str, Dict[str, Any]]:
+    """
+    jobs: {채널키: payload를 반환하는 callable} → {채널키: payload}
+    - Playwright 커넥터는 run_script(별도 서브프로세스), API 커넥터는 함수 직접 호출
+    - DAILY_MAX_PARALLEL(기본 5)로 동시 실행 수 제한 (로그인 rate-limit 대비)
+    """
+    max_workers = max(1, int(os.getenv("DAILY_MAX_PARALLEL", "5")))
+
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        futures = {key: ex.submit(job) for key, job in jobs.items()}
+        return {key: fut.result() for key, fut in futures.items()}
 
 
 # ---------------------------
 # Normalize channel payloads
 # ---------------------------
+def _int0(d: Dict[str, Any], key: str) -> int:
+    v = d.get(key)
+    return int(v) if v else 0
+
+
 def metrics_from_simple(payload: Dict[str, Any]) -> DailyMetrics:
-    return DailyMetrics(int(payload.get("sales", 0) or 0), int(payload.get("orders", 0) or 0))
+    return DailyMetrics(_int0(payload, "sales"), _int0(payload, "orders"))
 
 
 def metrics_from_coupang(payload: Dict[str, Any]) -> Dict[str, DailyMetrics]:
@@ -251,31 +493,30 @@ def metrics_from_coupang(payload: Dict[str, Any]) -> Dict[str, DailyMetrics]:
     br = mapped.get("brainology") or {}
 
     return {
-        "burdenzero": DailyMetrics(int(bz.get("sales", 0) or 0), int(bz.get("orders", 0) or 0)),
-        "brainology": DailyMetrics(int(br.get("sales", 0) or 0), int(br.get("orders", 0) or 0)),
+        "burdenzero": DailyMetrics(_int0(bz, "sales"), _int0(bz, "orders")),
+        "brainology": DailyMetrics(_int0(br, "sales"), _int0(br, "orders")),
     }
 
 
 def _as_int(v: Any) -> int:
+    # 흔한 int/float 경로는 예외 처리 없이 바로 반환
+    if v is None:
+        return 0
+    if isinstance(v, int):
+        return int(v)  # bool(True/False)도 1/0으로 정규화
+    if isinstance(v, float):
+        return int(v) if math.isfinite(v) else 0
+    s = _NONDIGIT_RE.sub("", str(v))
     try:
-        if v is None:
-            return 0
-        if isinstance(v, (int, float)):
-            return int(v)
-        s = str(v).strip()
-        if not s:
-            return 0
-        s = re.sub(r"[^\d\-]", "", s)
         return int(s) if s else 0
-    except Exception:
+    except ValueError:
+        # "1-2"처럼 숫자 사이에 '-'가 낀 경우
         return 0
 
 
-def _pick_first(d: Dict[str, Any], keys: List[str]) -> Any:
-    for k in keys:
-        if k in d and d.get(k) is not None:
-            return d.get(k)
-    return None
+# meta_ads payload에서 광고비/구매수로 인정하는 키 (앞쪽이 우선)
+_SPEND_KEYS = ("spend", "amount_spent", "ad_spend", "cost", "spend_krw", "cost_krw")
+_PURCH_KEYS = ("purchases", "purchase", "purchase_count", "orders", "results", "conversions")
 
 
 def metrics_from_meta_ads(payload: Dict[str, Any]) -> Dict[str, Tuple[int, int]]:
@@ -298,14 +539,8 @@ def metrics_from_meta_ads(payload: Dict[str, Any]) -> Dict[str, Tuple[int, int]]
             break
 
     def parse_brand(d: Dict[str, Any]) -> Tuple[int, int]:
-        spend_raw = _pick_first(
-            d,
-            ["spend", "amount_spent", "ad_spend", "cost", "spend_krw", "cost_krw"],
-        )
-        purch_raw = _pick_first(
-            d,
-            ["purchases", "purchase", "purchase_count", "orders", "results", "conversions"],
-        )
+        spend_raw = next((d[k] for k in _SPEND_KEYS if d.get(k) is not None), 0)
+        purch_raw = next((d[k] for k in _PURCH_KEYS if d.get(k) is not None), 0)
         return (_as_int(spend_raw), _as_int(purch_raw))
 
     bz = root.get("burdenzero") if isinstance(root, dict) else None
@@ -332,6 +567,14 @@ def metrics_from_meta_ads(payload: Dict[str, Any]) -> Dict[str, Tuple[int, int]]
 
 
 def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="커넥터 결과 캐시/시트 기존 값 무시하고 전부 새로 실행",
+    )
+    cli = ap.parse_args()
+
     load_dotenv()
     logging.basicConfig(
         level=os.getenv("LOG_LEVEL", "INFO"),
@@ -345,50 +588,75 @@ def main():
     # paths
     cafe24_path = os.path.join("connectors", "sales", "cafe24.py")
     coupang_path = os.path.join("connectors", "sales", "coupang.py")
-    naver_path = os.path.join("connectors", "sales", "naver.py")
     meta_ads_path = os.path.join("connectors", "ads", "meta_ads.py")
 
-    # 1) Cafe24 two accounts
-    cafe_bz_payload = run_script(cafe24_path, ["--profile", "burdenzero", "--date", date_str])
-    cafe_br_payload = run_script(cafe24_path, ["--profile", "brainology", "--date", date_str])
+    use_cache = not cli.no_cache
+
+    # 0) 시트에서 날짜 행 + 기존 값(A~K)을 먼저 읽음 (batchGet 1회)
+    gc = gspread_client_from_service_account()
+    sh = gc.open_by_key(SPREADSHEET_ID)
+
+    rows = read_rows_batch(sh, [SHEET_BURDENZERO, SHEET_BRAINOLOGY])
+
+    data: List[Dict[str, Any]] = []
+    row_bz = find_or_create_row_by_date(SHEET_BURDENZERO, col_a_of(rows[SHEET_BURDENZERO]), date_str, data)
+    row_br = find_or_create_row_by_date(SHEET_BRAINOLOGY, col_a_of(rows[SHEET_BRAINOLOGY]), date_str, data)
 
-    cafe_bz = metrics_from_simple(cafe_bz_payload)
-    cafe_br = metrics_from_simple(cafe_br_payload)
+    existing = {
+        SHEET_BURDENZERO: row_values_of(rows[SHEET_BURDENZERO], row_bz, date_str),
+        SHEET_BRAINOLOGY: row_values_of(rows[SHEET_BRAINOLOGY], row_br, date_str),
+    }
+
+    # 1~4) Cafe24 두 계정 + 쿠팡 + 네이버 + 메타: 서로 독립적이라 병렬 실행
+    jobs = {
+        "cafe24_bz": partial(run_script_cached, cafe24_path, ["--profile", "burdenzero", "--date", date_str], use_cache=use_cache),
+        "cafe24_br": partial(run_script_cached, cafe24_path, ["--profile", "brainology", "--date", date_str], use_cache=use_cache),
+        "coupang": partial(run_script_cached, coupang_path, ["--date", date_str], use_cache=use_cache),
+        "naver": partial(naver.get_daily_metrics, target_date=target_date),
+        "meta_ads": partial(run_script_cached, meta_ads_path, ["--date", date_str], use_cache=use_cache),
+    }
+
+    # 재실행 시 이미 시트에 다 채워진 채널은 생략 (--no-cache면 전부 실행)
+    payloads: Dict[str, Dict[str, Any]] = {}
+    if use_cache:
+        for channel in list(jobs):
+            sheet_payload = payload_from_sheet(channel, existing)
+            if sheet_payload is not None:
+                LOGGER.info("SKIP: %s (시트에 이미 기록됨)", channel)
+                payloads[channel] = sheet_payload
+                del jobs[channel]
+
+    payloads.update(run_jobs_parallel(jobs))
+
+    # 1) Cafe24 two accounts
+    cafe_bz = metrics_from_simple(payloads["cafe24_bz"])
+    cafe_br = metrics_from_simple(payloads["cafe24_br"])
 
     # 2) Coupang mixed -> mapped already
-    coupang_payload = run_script(coupang_path, ["--date", date_str, "--json"])
-    coupang = metrics_from_coupang(coupang_payload)
+    coupang = metrics_from_coupang(payloads["coupang"])
     coupang_bz = coupang["burdenzero"]
     coupang_br = coupang["brainology"]
 
     # 3) Naver (burdenzero only)
-    naver_payload = run_script(naver_path, ["--date", date_str, "--json"])
-    naver_bz = metrics_from_simple(naver_payload)
+    naver_bz = metrics_from_simple(payloads["naver"])
 
     # 4) Meta Ads (burdenzero + brainology)
-    meta_payload = run_script(meta_ads_path, ["--date", date_str, "--json"])
-    meta = metrics_from_meta_ads(meta_payload)
+    meta = metrics_from_meta_ads(payloads["meta_ads"])
     meta_bz_spend, meta_bz_purchases = meta["burdenzero"]
     meta_br_spend, meta_br_purchases = meta["brainology"]
 
     # 5) Write to Google Sheets
-    gc = gspread_client_from_service_account()
-    sh = gc.open_by_key(SPREADSHEET_ID)
-
-    ws_bz = sh.worksheet(SHEET_BURDENZERO)
-    ws_br = sh.worksheet(SHEET_BRAINOLOGY)
-
-    row_bz = find_or_create_row_by_date(ws_bz, date_str)
-    row_br = find_or_create_row_by_date(ws_br, date_str)
-
     # 부담제로: B~G 모두
-    write_metrics_row(ws_bz, row_bz, cafe24=cafe_bz, coupang=coupang_bz, naver=naver_bz)
+    data.append(metrics_row_update(SHEET_BURDENZERO, row_bz, cafe24=cafe_bz, coupang=coupang_bz, naver=naver_bz))
     # 뉴턴젤리: 카페24/쿠팡만, 네이버는 없음
-    write_metrics_row(ws_br, row_br, cafe24=cafe_br, coupang=coupang_br, naver=None)
+    data.append(metrics_row_update(SHEET_BRAINOLOGY, row_br, cafe24=cafe_br, coupang=coupang_br, naver=None))
 
     # 메타 광고비/구매수: J~K
-    write_meta_row(ws_bz, row_bz, spend=meta_bz_spend, purchases=meta_bz_purchases)
-    write_meta_row(ws_br, row_br, spend=meta_br_spend, purchases=meta_br_purchases)
+    data.append(meta_row_update(SHEET_BURDENZERO, row_bz, spend=meta_bz_spend, purchases=meta_bz_purchases))
+    data.append(meta_row_update(SHEET_BRAINOLOGY, row_br, spend=meta_br_spend, purchases=meta_br_purchases))
+
+    # A열(신규 날짜) + B~G + J~K 전체를 한 번에 기록
+    batch_update_values(sheets_session_from_service_account(), SPREADSHEET_ID, data)
 
     # ✅ Slack 요약 전송 (추가: 시트 작성 이후)
     bz_total_sales = cafe_bz.sales + coupang_bz.sales + naver_bz.sales